@@ -53,16 +53,20 @@ export const updateJobProgress = async (req, res) => {
 };
 
 // POST /api/jobs/:jobId/logs
+// Body is a single { log, timestamp } or a batch { entries: [{ log, timestamp }, ...] }
 export const addJobLog = async (req, res) => {
   try {
     const { jobId } = req.params;
-    const { log, timestamp } = req.body;
+    const { log, timestamp, entries } = req.body;
 
-    const logLine = `${timestamp || new Date().toISOString()} LOG: ${log}`;
+    // Every line is stored as its own log entry, batch or not
+    const logLines = (entries || [{ log, timestamp }]).map(
+      (entry) => `${entry.timestamp || new Date().toISOString()} LOG: ${entry.log}`
+    );
 
     await ScrapingJob.findOneAndUpdate(
       { jobId },
-      { $push: { logs: logLine }, updatedAt: new Date() },
+      { $push: { logs: { $each: logLines } }, updatedAt: new Date() },
       { new: true }
     );
 
@@ -1,30 +1,114 @@
 import argparse
+import atexit
 import sys
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
 import time
 import random
 import csv
+import io
 import os
+import shutil
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Set
+from logging.handlers import MemoryHandler, RotatingFileHandler
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
+from typing import Any, Dict, List, Optional, Set
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 
 # Configuration Constants
 DEFAULT_CSV_FILE = 'amazon_products.csv'
 DEFAULT_JSON_FILE = 'amazon_products.json'
+DEFAULT_ASINS_FILE = 'amazon_products.asins'
+DEFAULT_RECORDS_FILE = 'amazon_products.records'
 PROGRESS_FILE = 'scraper_progress.json'
 LOG_FILE = 'scraper.log'
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_MAX_BYTES = 5 * 1024 * 1024  # Rotate the log file at this size
+LOG_BACKUP_COUNT = 3  # Rotated log files to keep
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:5000/api")
 SCRAPER_SECRET = os.getenv("SCRAPER_SECRET", "")
+API_HEADERS = {'x-scraper-secret': SCRAPER_SECRET} if SCRAPER_SECRET else {}
+API_DRAIN_TIMEOUT = 30  # Seconds cleanup waits for queued job updates to be posted
+API_LOG_BATCH = 50  # Most queued log lines sent in one webhook post, each stored as its own entry
+AMAZON_BASE_URL = "https://www.amazon.in"
+# Browser identities picked from at random for each session
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2.1 Safari/605.1.15",
+)
+# Markers of Amazon's robot check page, used to fall back from HTTP to the browser
+BOT_CHECK_MARKERS = ("Enter the characters you see", "/errors/validateCaptcha")
+# Resource URLs the browser never needs to fetch for the results markup
+BLOCKED_URL_PATTERNS = (
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.css",
+    "*google-analytics*", "*doubleclick*", "*amazon-adsystem*",
+)
+POLITENESS_DELAY = (3, 6)  # Random wait range in seconds before each further results page
+PAGE_RETRY_LIMIT = 3  # Consecutive failures on one results page before the run stops
+
+PROGRESS_SAVE_EVERY = 10  # Save progress and flush the CSV after this many scraped rows
+PROGRESS_MIN_INTERVAL = 2.0  # Seconds between mid-page progress saves
+
+CSV_HEADERS = (
+    'timestamp', 'asin', 'title', 'price', 'original_price',
+    'rating', 'review_count', 'image_url', 'product_url',
+    'best_seller', 'delivery_info', 'page_number', 'scraped_successfully'
+)
+
+# Scripts run in the browser
+NAVIGATOR_PATCH_JS = (
+    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+    "Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});"
+    "Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});"
+)
+CARD_HTML_JS = "return Array.from(document.querySelectorAll(arguments[0]), card => card.outerHTML).join('');"
+
+# CSS selectors, in priority order where several are tried
+PRODUCT_CARD_SELECTOR = "div[data-component-type='s-search-result']"
+TITLE_SELECTORS = ("h2 span", "h2 a span", "[data-cy='title-recipe'] span")
+PRICE_SELECTORS = (".a-price-whole", ".a-price .a-offscreen", ".a-price-range .a-price .a-offscreen")
+MRP_SELECTOR = "span.a-text-price > span.a-offscreen"
+RATING_SELECTORS = ("i.a-icon-star-small span.a-icon-alt", "span.a-icon-alt")
+REVIEW_SELECTORS = ("a[aria-label*='ratings'] span", ".a-size-base.s-underline-text")
+IMAGE_SELECTORS = (".s-image", "img[data-image-index]")
+BADGE_SELECTOR = ".a-badge-text"
+DELIVERY_SELECTORS = (".udm-primary-delivery-message", "[data-cy='delivery-block']")
+
+# Frame of the end-of-run summary
+SUMMARY_RULE = "=" * 70
+SUMMARY_BANNER = f"🎯{'═' * 64}🎯"
+
+SAFE_NAME_TABLE = str.maketrans(" ", "_")  # Product name -> file name: spaces become underscores
+
+REVIEW_COUNT_RE = re.compile(r'\d[\d,]*')
+MRP_RE = re.compile(r'₹[\d,]+')
+RATING_RE = re.compile(r'([\d.]+)\s*out of 5 stars')
+SAFE_NAME_RE = re.compile(r'[^\w\-_]')
+
+@lru_cache(maxsize=None)
+def compiled_selector(selector: str) -> CSSSelector:
+    """CSS selector translated to XPath once and reused for every card and page"""
+    return CSSSelector(selector, translator='html')
 
 class StatusCode(Enum):
     SUCCESS = 200
@@ -35,34 +119,80 @@ class StatusCode(Enum):
     ALREADY_EXISTS = 409
     RATE_LIMITED = 429
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingResult:
     status_code: StatusCode
     message: str
-    data: Optional[Dict] = None
+    data: Optional[Any] = None
     error_details: Optional[str] = None
 
+@dataclass(slots=True)
+class Product:
+    """One scraped product; field order matches the CSV columns between timestamp and page_number"""
+    asin: str = ""
+    title: str = ""
+    price: str = ""
+    original_price: str = ""
+    rating: str = ""
+    review_count: str = ""
+    image_url: str = ""
+    product_url: str = ""
+    best_seller: str = "NO"
+    delivery_info: str = ""
+
+# Logger extra for records that stay in the local log and are not sent to the job log API
+NO_JOB_LOG = {'job_log': False}
+
+# Reads a Product's fields as a tuple; unlike dataclasses.astuple it does not deep-copy each value
+PRODUCT_FIELDS = attrgetter(*(field.name for field in fields(Product)))
+
+class JobLogHandler(logging.Handler):
+    """Forwards the scraper's log records to the job log API"""
+    
+    def __init__(self, scraper: "EnhancedAmazonScraper"):
+        super().__init__(level=logging.INFO)
+        self.scraper = scraper
+    
+    def emit(self, record: logging.LogRecord):
+        if getattr(record, 'job_log', True):
+            self.scraper.add_job_log(record.getMessage())
+
 class EnhancedAmazonScraper:
-    def __init__(self, headless: bool = False, enable_proxy: bool = False, job_id: str = None):
+    def __init__(self, headless: bool = False, enable_proxy: bool = False, job_id: str = None,
+                 use_http: bool = False, attach_port: Optional[int] = None):
         self.job_id = job_id
         # Create output directories if they don't exist
         self.setup_output_directories()
         
         # Initialize default file paths BEFORE setup_logging()
         self.csv_file = os.path.join(self.csv_dir, DEFAULT_CSV_FILE)
+        self.asins_file = os.path.join(self.csv_dir, DEFAULT_ASINS_FILE)
         self.json_file = os.path.join(self.json_dir, DEFAULT_JSON_FILE)
+        self.records_file = os.path.join(self.json_dir, DEFAULT_RECORDS_FILE)
         self.log_file = os.path.join(self.log_dir, LOG_FILE)
         self.progress_file = os.path.join(self.log_dir, PROGRESS_FILE)
         
         # Now setup logging with the initialized log_file path
         self.setup_logging()
         
+        # Job updates are posted from a background thread over one pooled session
+        self._api_session = None
+        self._api_queue = None
+        self._api_thread = None
+        # Latest progress payload not yet posted; newer updates replace it while it waits
+        self._queued_progress = None
+        self._progress_lock = threading.Lock()
+        self._job_log_handler = None
+        if self.job_id:
+            self.start_api_worker()
+        
         self.scraped_asins: Set[str] = set()
         self.total_scraped = 0
         self.session_scraped = 0
         self.current_page = 1
         self.headless = headless
         self.enable_proxy = enable_proxy
+        self.attach_port = attach_port
         self.product_name = ""
         
         # Proxy configuration (commented out by default)
@@ -74,11 +204,52 @@ class EnhancedAmazonScraper:
         self.current_proxy_index = 0
         
         self.browser = None
+        
+        # Optional browserless mode: fetch result pages with plain HTTP
+        self.use_http = use_http
+        self.http_session = None
+        self.search_term = ""
+        self._page_html = None
+        self._parsed_page = None
+        # Single background worker that fetches the next results page while this one is processed
+        self._prefetch_pool = None
+        self._prefetch = None
+        # Set by cleanup() so a prefetch still in its politeness delay never makes its request
+        self._prefetch_stop = threading.Event()
+        
+        # Long-lived CSV handle, opened once in initialize_csv()
+        self._csv_fh = None
+        self._csv_writer = None
+        # Successful rows in the CSV: counted once in initialize_csv(), then kept up to date by save_to_csv()
+        self._csv_record_count = None
+        
+        # ASIN sidecar (one ASIN per saved row), appended only after the CSV rows are flushed
+        self._asins_fh = None
+        self._pending_asins: List[str] = []
+        
+        # JSON records sidecar: each saved row already serialized, so the final JSON is a byte copy.
+        # Records wait in memory until their CSV rows are flushed, so the sidecar never gets ahead
+        self._records_fh = None
+        self._pending_records: List[bytes] = []
+        self._json_record_count = 0
+        
+        # Progress snapshots are written to a temp file and renamed over the previous one
+        self._last_progress_save = 0.0
+        self._pending_progress = None
+        
+        # (epoch second, CSV string, ISO string) cache for row and API timestamps
+        self._ts_cache = (0, "", "")
+        
+        # Set once cleanup() has run so a second call is a no-op
+        self._cleaned = False
+        # Final totals and output paths, filled in by cleanup()
+        self.result_summary = None
 
         
     def setup_output_directories(self):
         """Create output directories if they don't exist"""
-        # Get the base directory (one level up from scripts folder)
+        # Get the base directory (one level up from scripts folder); every output path
+        # below is built from it, so they are all absolute already
         base_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "output_files")
         
         # Define directory paths
@@ -91,13 +262,28 @@ class EnhancedAmazonScraper:
         os.makedirs(self.json_dir, exist_ok=True)
         os.makedirs(self.log_dir, exist_ok=True)
         
+    def buffered_log_file_handler(self) -> logging.Handler:
+        """Rotating log file behind a memory buffer that writes records in batches"""
+        file_handler = RotatingFileHandler(self.log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+                                           encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        # Errors are written straight away; everything else once 512 records have built up,
+        # at every page boundary (flush_log_file) and when the interpreter exits
+        self._log_buffer = MemoryHandler(capacity=512, flushLevel=logging.ERROR, target=file_handler)
+        atexit.register(self._log_buffer.flush)
+        return self._log_buffer
+
+    def flush_log_file(self):
+        """Write the buffered log records to the log file"""
+        self._log_buffer.flush()
+
     def setup_logging(self):
         """Setup comprehensive logging"""
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            format=LOG_FORMAT,
             handlers=[
-                logging.FileHandler(self.log_file, encoding='utf-8'),
+                self.buffered_log_file_handler(),
                 logging.StreamHandler(sys.stdout)  # Output to stdout for Node.js capture
             ]
         )
@@ -105,338 +291,624 @@ class EnhancedAmazonScraper:
 
     def reconfigure_logging(self):
         """Reconfigure logging with new file handlers"""
-        # Remove existing file handlers
+        # Remove existing file handlers, writing out whatever they still buffer
         for handler in self.logger.handlers[:]:
-            if isinstance(handler, logging.FileHandler):
+            if isinstance(handler, MemoryHandler):
                 self.logger.removeHandler(handler)
+                target = handler.target
+                handler.close()
+                target.close()
         
         # Add new file handler with the updated log file path
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
-        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        self.logger.addHandler(file_handler)
+        self.logger.addHandler(self.buffered_log_file_handler())
+
+    def start_api_worker(self):
+        """Open the pooled API session and start the thread that posts job updates"""
+        self._api_session = requests.Session()
+        self._api_session.headers.update(API_HEADERS)
+        self._api_session.headers['Content-Type'] = 'application/json'
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self._api_session.mount("http://", adapter)
+        self._api_session.mount("https://", adapter)
+        
+        self._api_queue = queue.Queue()
+        self._api_thread = threading.Thread(target=self._api_worker, args=(self._api_queue,),
+                                            name="job-api", daemon=True)
+        self._api_thread.start()
+        
+        # Every INFO-or-above record on self.logger is also queued for the job log
+        self._job_log_handler = JobLogHandler(self)
+        self.logger.addHandler(self._job_log_handler)
+
+    def _api_worker(self, api_queue: queue.Queue):
+        """Post queued job updates in order until the stop sentinel arrives"""
+        carried = []
+        while True:
+            item = carried.pop() if carried else api_queue.get()
+            if item is None:
+                return
+            endpoint, data = item
+            if endpoint == 'batch':
+                # Page boundary marker: it only ends the log batch before it
+                continue
+            if endpoint == 'logs':
+                # Send the log lines already queued behind this one in the same post
+                entries = [data]
+                while len(entries) < API_LOG_BATCH:
+                    try:
+                        following = api_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if following is None or following[0] != 'logs':
+                        carried.append(following)
+                        break
+                    entries.append(following[1])
+                if len(entries) > 1:
+                    data = {'entries': entries}
+            elif endpoint == 'progress':
+                with self._progress_lock:
+                    data, self._queued_progress = self._queued_progress, None
+            try:
+                self._api_session.post(f"{API_BASE_URL}/jobs/{self.job_id}/{endpoint}",
+                                       data=orjson.dumps(data), timeout=5)
+            except Exception as e:
+                self.logger.warning("Failed to post job %s: %s", endpoint, e, extra=NO_JOB_LOG)
+
+    def stop_api_worker(self):
+        """Deliver the queued job updates, then close the API session"""
+        if self._api_queue is None:
+            return
+        self.logger.removeHandler(self._job_log_handler)
+        self._api_queue.put(None)
+        self._api_queue = None
+        self._api_thread.join(timeout=API_DRAIN_TIMEOUT)
+        self._api_session.close()
 
     def update_job_status(self, status: str, message: str = "", error: str = None):
-        """Update job status via API"""
-        if not self.job_id:
+        """Queue a job status update for the API"""
+        if self._api_queue is None:
             return
             
-        try:
-            data = {
-                'status': status,
-                'message': message,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            if error:
-                data['error'] = error
-            headers = {'x-scraper-secret': SCRAPER_SECRET} if SCRAPER_SECRET else {}    
-            response = requests.post(
-                f"{API_BASE_URL}/jobs/{self.job_id}/status",
-                json=data,
-                timeout=5
-            )
-        except Exception as e:
-            self.logger.warning(f"Failed to update job status: {e}")
+        data = {
+            'status': status,
+            'message': message,
+            'timestamp': self._now_strings()[1]
+        }
+        
+        if error:
+            data['error'] = error
+        self._api_queue.put(('status', data))
 
     def update_job_progress(self, current_product: int, total_products: int, current_page: int, percentage: float):
-        """Update job progress via API"""
-        if not self.job_id:
+        """Queue a job progress update for the API"""
+        if self._api_queue is None:
             return
             
-        try:
-            data = {
-                'progress': {
-                    'currentProduct': current_product,
-                    'totalProducts': total_products,
-                    'currentPage': current_page,
-                    'percentage': percentage
-                },
-                'timestamp': datetime.now().isoformat()
-            }
-            headers = {'x-scraper-secret': SCRAPER_SECRET} if SCRAPER_SECRET else {}
-            response = requests.post(
-                f"{API_BASE_URL}/jobs/{self.job_id}/progress",
-                json=data,
-                timeout=5
-            )
-        except Exception as e:
-            self.logger.warning(f"Failed to update job progress: {e}")
+        data = {
+            'progress': {
+                'currentProduct': current_product,
+                'totalProducts': total_products,
+                'currentPage': current_page,
+                'percentage': percentage
+            },
+            'timestamp': self._now_strings()[1]
+        }
+        with self._progress_lock:
+            already_queued = self._queued_progress is not None
+            self._queued_progress = data
+        # Only one progress entry waits in the queue; the worker posts whatever is latest when it gets there
+        if not already_queued:
+            self._api_queue.put(('progress', None))
 
     def add_job_log(self, log_message: str):
-        """Add log entry via API"""
-        if not self.job_id:
+        """Queue a log entry for the API"""
+        if self._api_queue is None:
             return
             
-        try:
-            data = {
-                'log': log_message,
-                'timestamp': datetime.now().isoformat()
-            }
-            headers = {'x-scraper-secret': SCRAPER_SECRET} if SCRAPER_SECRET else {}
-            response = requests.post(
-                f"{API_BASE_URL}/jobs/{self.job_id}/logs",
-                json=data,
-                timeout=5
-            )
-        except Exception as e:
-            self.logger.warning(f"Failed to add job log: {e}")
+        data = {
+            'log': log_message,
+            'timestamp': self._now_strings()[1]
+        }
+        self._api_queue.put(('logs', data))
+
+    def end_job_log_batch(self):
+        """Stop the queued log lines so far from being batched with the ones that follow"""
+        if self._api_queue is not None:
+            self._api_queue.put(('batch', None))
 
     def set_product_name(self, product_name: str):
         """Set product name and update file paths"""
         self.product_name = product_name.strip()
         if self.product_name:
-            safe_name = self.product_name.replace(" ", "_").lower()
+            safe_name = self.product_name.lower().translate(SAFE_NAME_TABLE)
             # Remove any special characters that might cause file issues
-            safe_name = re.sub(r'[^\w\-_]', '', safe_name)
+            safe_name = SAFE_NAME_RE.sub('', safe_name)
             self.csv_file = os.path.join(self.csv_dir, f"{safe_name}.csv")
+            self.asins_file = os.path.join(self.csv_dir, f"{safe_name}.asins")
             self.json_file = os.path.join(self.json_dir, f"{safe_name}.json")
+            self.records_file = os.path.join(self.json_dir, f"{safe_name}.records")
             self.log_file = os.path.join(self.log_dir, f"{safe_name}.log")
             self.progress_file = os.path.join(self.log_dir, f"{safe_name}_progress.json")
         else:
             # Use default file names if no product name provided
             self.csv_file = os.path.join(self.csv_dir, DEFAULT_CSV_FILE)
+            self.asins_file = os.path.join(self.csv_dir, DEFAULT_ASINS_FILE)
             self.json_file = os.path.join(self.json_dir, DEFAULT_JSON_FILE)
+            self.records_file = os.path.join(self.json_dir, DEFAULT_RECORDS_FILE)
             self.log_file = os.path.join(self.log_dir, LOG_FILE)
             self.progress_file = os.path.join(self.log_dir, PROGRESS_FILE)
         
         # Reconfigure logging with the new log file
         self.reconfigure_logging()
         
-        self.logger.info(f"📁 Using files: CSV={self.csv_file}, JSON={self.json_file}")
-        self.add_job_log(f"📁 Using files: CSV={self.csv_file}, JSON={self.json_file}")
+        self.logger.info("📁 Using files: CSV=%s, JSON=%s", self.csv_file, self.json_file)
 
     def get_random_user_agent(self) -> str:
         """Get random user agent to mimic different browsers"""
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2.1 Safari/605.1.15"
-        ]
-        return random.choice(user_agents)
+        return random.choice(USER_AGENTS)
 
     def setup_proxy(self, chrome_options):
         """Setup proxy configuration (commented out by default)"""
         if self.enable_proxy and self.proxy_list:
             proxy = self.proxy_list[self.current_proxy_index % len(self.proxy_list)]
             chrome_options.add_argument(f'--proxy-server={proxy}')
-            self.logger.info(f"Using proxy: {proxy}")
+            self.logger.info("Using proxy: %s", proxy, extra=NO_JOB_LOG)
             self.current_proxy_index += 1
         
+    def build_chrome_options(self) -> webdriver.ChromeOptions:
+        """Launch options for a fresh Chrome with human-like settings"""
+        chrome_options = webdriver.ChromeOptions()
+        
+        # Anti-detection measures
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-web-security")
+        chrome_options.add_argument("--allow-running-insecure-content")
+        
+        # Random user agent
+        chrome_options.add_argument(f"--user-agent={self.get_random_user_agent()}")
+        
+        # Window size randomization
+        width = random.randint(1200, 1920)
+        height = random.randint(800, 1080)
+        chrome_options.add_argument(f"--window-size={width},{height}")
+        
+        if self.headless:
+            chrome_options.add_argument("--headless")
+        
+        # Skip images and fonts; product data is read from the markup only
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+        
+        return chrome_options
+
     def initialize_browser(self) -> ScrapingResult:
-        """Initialize Chrome browser with human-like settings"""
+        """Initialize Chrome browser with human-like settings, or attach to a running one"""
         try:
-            chrome_options = webdriver.ChromeOptions()
+            if self.attach_port:
+                # Drive a Chrome started with --remote-debugging-port; launch flags do not apply to it
+                chrome_options = webdriver.ChromeOptions()
+                chrome_options.add_experimental_option("debuggerAddress", f"127.0.0.1:{self.attach_port}")
+            else:
+                chrome_options = self.build_chrome_options()
             
-            # Anti-detection measures
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-web-security")
-            chrome_options.add_argument("--allow-running-insecure-content")
+            self.browser = webdriver.Chrome(options=chrome_options)
+            if self.attach_port:
+                # Work in a tab of our own so the CDP settings below and every navigation stay
+                # out of the tabs other sessions use; cleanup() closes it again
+                self.browser.switch_to.new_window('tab')
             
-            # Random user agent
-            chrome_options.add_argument(f"--user-agent={self.get_random_user_agent()}")
+            # Block the remaining heavy or third-party requests at the network layer
+            self.browser.execute_cdp_cmd("Network.enable", {})
+            self.browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
             
-            # Window size randomization
-            width = random.randint(1200, 1920)
-            height = random.randint(800, 1080)
-            chrome_options.add_argument(f"--window-size={width},{height}")
+            # Additional anti-detection, injected before page scripts on every document
+            self.browser.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NAVIGATOR_PATCH_JS})
             
-            if self.headless:
-                chrome_options.add_argument("--headless")
+            if self.attach_port:
+                self.logger.info("🌐 Attached to running browser on port %s", self.attach_port)
+            else:
+                self.logger.info("🌐 Browser initialized successfully")
             
-            self.browser = webdriver.Chrome(options=chrome_options)
+            return ScrapingResult(StatusCode.SUCCESS, "Browser initialized successfully")
             
-            # Additional anti-detection
-            self.browser.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.browser.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
-            self.browser.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']})")
+        except Exception as e:
+            self.logger.error("❌ Failed to initialize browser: %s", e)
+            return ScrapingResult(StatusCode.ERROR, "Failed to initialize browser", error_details=str(e))
+
+    def initialize_http_session(self) -> ScrapingResult:
+        """Create a keep-alive HTTP session for fetching result pages without a browser"""
+        try:
+            self.http_session = requests.Session()
+            self.http_session.headers.update({
+                "User-Agent": self.get_random_user_agent(),
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-IN,en;q=0.9",
+            })
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
             
-            log_msg = "🌐 Browser initialized successfully"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            self.logger.info("🌐 HTTP session initialized successfully")
             
-            return ScrapingResult(StatusCode.SUCCESS, "Browser initialized successfully")
+            return ScrapingResult(StatusCode.SUCCESS, "HTTP session initialized successfully")
             
         except Exception as e:
-            error_msg = f"Failed to initialize browser: {str(e)}"
-            self.logger.error(error_msg)
-            self.add_job_log(f"❌ {error_msg}")
-            return ScrapingResult(StatusCode.ERROR, "Failed to initialize browser", error_details=str(e))
+            self.logger.error("❌ Failed to initialize HTTP session: %s", e)
+            return ScrapingResult(StatusCode.ERROR, "Failed to initialize HTTP session", error_details=str(e))
+
+    def build_search_url(self, page_number: int) -> str:
+        """Build the results URL for the current search term and page"""
+        return f"{AMAZON_BASE_URL}/s?k={quote_plus(self.search_term)}&page={page_number}"
+
+    def fetch_search_page(self, page_number: int) -> ScrapingResult:
+        """Fetch a results page over HTTP and detect Amazon's robot check"""
+        try:
+            response = self.http_session.get(self.build_search_url(page_number), timeout=15)
+            html = response.text
+            
+            if response.status_code == 503 or any(marker in html for marker in BOT_CHECK_MARKERS):
+                return ScrapingResult(StatusCode.RATE_LIMITED, f"Robot check served for page {page_number}")
+            if response.status_code != 200:
+                return ScrapingResult(StatusCode.ERROR, f"HTTP {response.status_code} for page {page_number}")
+            if 'data-component-type="s-search-result"' not in html:
+                return ScrapingResult(StatusCode.NOT_FOUND, f"No results on page {page_number}")
+            
+            return ScrapingResult(StatusCode.SUCCESS, f"Fetched page {page_number} over HTTP", data=html)
+            
+        except requests.RequestException as e:
+            return ScrapingResult(StatusCode.ERROR, f"Failed to fetch page {page_number}", error_details=str(e))
+
+    def switch_to_browser(self, page_number: int) -> ScrapingResult:
+        """Fall back from HTTP mode to Selenium and open the given results page"""
+        self.use_http = False
+        self._page_html = None
+        self._prefetch = None
+        
+        result = self.initialize_browser()
+        if result.status_code != StatusCode.SUCCESS:
+            return result
+        
+        try:
+            self.browser.get(self.build_search_url(page_number))
+            WebDriverWait(self.browser, 20).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR))
+            )
+            return ScrapingResult(StatusCode.SUCCESS, f"Opened page {page_number} in the browser")
+        except Exception as e:
+            self.logger.error("❌ Browser fallback failed: %s", e)
+            return ScrapingResult(StatusCode.ERROR, "Browser fallback failed", error_details=str(e))
 
-    def human_like_typing(self, element, text: str):
-        """Simulate human-like typing with random delays"""
-        element.clear()
-        for char in text:
-            element.send_keys(char)
-            time.sleep(random.uniform(0.05, 0.2))
+    def load_search_page_http(self, page_number: int) -> ScrapingResult:
+        """Load a results page over HTTP, switching to the browser if Amazon blocks it"""
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is not None and prefetch[0] == page_number:
+            result = prefetch[1].result()
+        else:
+            result = self.fetch_search_page(page_number)
+        if result.status_code == StatusCode.SUCCESS:
+            self._page_html = result.data
+            return result
+        if result.status_code == StatusCode.NOT_FOUND:
+            return result
+        
+        self.logger.warning("🤖 [%s] %s, falling back to the browser", result.status_code.value, result.message)
+        return self.switch_to_browser(page_number)
+
+    def _fetch_after_delay(self, page_number: int) -> ScrapingResult:
+        """Background task: honour the politeness delay, then fetch the page"""
+        if self._prefetch_stop.wait(random.uniform(*POLITENESS_DELAY)):
+            return ScrapingResult(StatusCode.ERROR, f"Prefetch of page {page_number} cancelled")
+        return self.fetch_search_page(page_number)
+
+    def prefetch_search_page(self, page_number: int):
+        """Start fetching a results page in the background (HTTP mode only)"""
+        if self.use_http and self._prefetch_pool is not None and self._prefetch is None:
+            self._prefetch = (page_number, self._prefetch_pool.submit(self._fetch_after_delay, page_number))
 
     def random_delay(self, min_seconds: float = 2.0, max_seconds: float = 4.0):
         """Add random delay with status logging"""
         delay = random.uniform(min_seconds, max_seconds)
-        log_msg = f"⏳ Random delay: {delay:.2f}s"
-        self.logger.info(log_msg)
-        self.add_job_log(log_msg)
+        self.logger.info("⏳ Random delay: %.2fs", delay)
         time.sleep(delay)
 
-    def pagination_delay(self, page_number: int):
-        """Special delay for pagination to avoid detection"""
-        base_delay = 30  # 30 seconds base
-        random_extra = random.uniform(5, 15)  # Extra 5-15 seconds
-        total_delay = base_delay + random_extra
-        
-        log_msg = f"📄 Page {page_number} navigation delay: {total_delay:.1f}s"
-        self.logger.info(log_msg)
-        self.add_job_log(log_msg)
-        time.sleep(total_delay)
-
     def initialize_csv(self) -> ScrapingResult:
-        """Initialize CSV file with headers"""
+        """Initialize CSV file with headers and open it for appending"""
         try:
-            if not os.path.exists(self.csv_file):
-                with open(self.csv_file, 'w', newline='', encoding='utf-8') as file:
-                    writer = csv.writer(file)
-                    writer.writerow([
-                        'timestamp', 'asin', 'title', 'price', 'original_price', 
-                        'rating', 'review_count', 'image_url', 'product_url',
-                        'best_seller', 'delivery_info', 'page_number', 'scraped_successfully'
-                    ])
-                log_msg = f"📄 Created new CSV file: {self.csv_file}"
-                self.logger.info(log_msg)
-                self.add_job_log(log_msg)
+            self._csv_fh = open(self.csv_file, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+            self._csv_writer = csv.writer(self._csv_fh)
+            
+            # Append mode starts at the end, so an empty position means there is no header yet
+            if self._csv_fh.tell() == 0:
+                # A fresh CSV invalidates any sidecars left from a previous file
+                for sidecar in (self.asins_file, self.records_file):
+                    try:
+                        os.remove(sidecar)
+                    except FileNotFoundError:
+                        pass
+                self._csv_writer.writerow(CSV_HEADERS)
+                self._csv_fh.flush()
+                self._csv_record_count = 0
+                self.open_records_file()
+                self.logger.info("📄 Created new CSV file: %s", self.csv_file)
                 return ScrapingResult(StatusCode.SUCCESS, f"Created new CSV file: {self.csv_file}")
             else:
-                log_msg = f"📄 Using existing CSV file: {self.csv_file}"
-                self.logger.info(log_msg)
-                self.add_job_log(log_msg)
+                # The only full scan of an existing CSV; the sidecars and the summary reuse this count
+                self._csv_record_count = self.count_scraped_records()
+                self.open_records_file()
+                self.logger.info("📄 Using existing CSV file: %s", self.csv_file)
                 return ScrapingResult(StatusCode.ALREADY_EXISTS, f"Using existing CSV file: {self.csv_file}")
         except Exception as e:
-            error_msg = f"Failed to initialize CSV: {str(e)}"
-            self.logger.error(error_msg)
-            self.add_job_log(f"❌ {error_msg}")
+            self.logger.error("❌ Failed to initialize CSV: %s", e)
             return ScrapingResult(StatusCode.ERROR, "Failed to initialize CSV", error_details=str(e))
 
-    def save_to_csv(self, product_data: Dict, page_number: int) -> ScrapingResult:
+    def _now_strings(self) -> tuple:
+        """Current time as (CSV, ISO 8601) strings, formatted at most once per second"""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            local = time.localtime(now)
+            self._ts_cache = (now, time.strftime('%Y-%m-%d %H:%M:%S', local),
+                              time.strftime('%Y-%m-%dT%H:%M:%S', local))
+        return self._ts_cache[1:]
+
+    def save_to_csv(self, product: Product, page_number: int) -> ScrapingResult:
         """Save product data to CSV"""
         try:
-            file_exists = os.path.isfile(self.csv_file)
-
-            with open(self.csv_file, 'a', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-
-                # Write headers only once
-                if not file_exists:
-                    writer.writerow([
-                        "timestamp", "asin", "title", "price", "original_price",
-                        "rating", "review_count", "image_url", "product_url",
-                        "best_seller", "delivery_info", "page_number", "scraped_successfully"
-                    ])
-
-                writer.writerow([
-                    datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    product_data.get('asin', ''),
-                    product_data.get('title', ''),
-                    product_data.get('price', ''),
-                    product_data.get('original_price', ''),
-                    product_data.get('rating', ''),
-                    product_data.get('review_count', ''),
-                    product_data.get('image_url', ''),
-                    product_data.get('product_url', ''),
-                    product_data.get('best_seller', ''),
-                    product_data.get('delivery_info', ''),
-                    page_number,
-                    'YES'
-                ])
-            
-            log_msg = f"💾 Saved ASIN {product_data.get('asin', 'Unknown')} to CSV"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
-            return ScrapingResult(StatusCode.SUCCESS, f"Saved ASIN {product_data.get('asin', 'Unknown')} to CSV")
+            if self._csv_writer is None:
+                return ScrapingResult(StatusCode.ERROR, "Failed to save to CSV", error_details="CSV file is not open")
+
+            row = (self._now_strings()[0], *PRODUCT_FIELDS(product), str(page_number), 'YES')
+            self._csv_writer.writerow(row)
+            self._csv_record_count += 1
+            self.write_json_record(dict(zip(CSV_HEADERS, row)))
+            self.scraped_asins.add(product.asin)
+            if self._asins_fh is not None:
+                self._pending_asins.append(product.asin)
+            
+            self.logger.info("💾 Saved ASIN %s to CSV", product.asin or 'Unknown')
+            return ScrapingResult(StatusCode.SUCCESS, f"Saved ASIN {product.asin or 'Unknown'} to CSV")
         except Exception as e:
-            error_msg = f"Failed to save to CSV: {str(e)}"
-            self.logger.error(error_msg)
-            self.add_job_log(f"❌ {error_msg}")
+            self.logger.error("❌ Failed to save to CSV: %s", e)
             return ScrapingResult(StatusCode.ERROR, "Failed to save to CSV", error_details=str(e))
 
+    def close_csv(self):
+        """Flush and close the long-lived CSV and ASIN sidecar handles"""
+        try:
+            if self._csv_fh is not None:
+                self._csv_fh.close()
+            self.write_pending_sidecars()
+        finally:
+            self._csv_fh = None
+            self._csv_writer = None
+            if self._asins_fh is not None:
+                self._asins_fh.close()
+                self._asins_fh = None
+            if self._records_fh is not None:
+                self._records_fh.close()
+                self._records_fh = None
+
+    def csv_records(self):
+        """Yield the successfully scraped CSV rows as JSON-ready dicts"""
+        with open(self.csv_file, "r", newline="", encoding="utf-8", buffering=1 << 20) as src:
+            reader = csv.reader(src)
+            # Resolve column positions once instead of building a dict per input row
+            positions = {name: index for index, name in enumerate(next(reader, []))}
+            columns = [(field, positions.get(field)) for field in CSV_HEADERS]
+            status_index = positions.get("scraped_successfully")
+            if status_index is None:
+                return
+            
+            for row in reader:
+                if len(row) <= status_index or row[status_index] != "YES":
+                    continue
+                # Re-map into clean structure
+                yield {field: row[index] if index is not None and index < len(row) else ""
+                       for field, index in columns}
+
+    def count_json_records(self) -> int:
+        """Count the records in the JSON sidecar without parsing them"""
+        # Values are flat strings, so every record and only a record starts a line with '{'
+        count = 0
+        with open(self.records_file, 'rb') as file:
+            tail = b'\n'
+            while chunk := file.read(1 << 20):
+                count += (tail + chunk).count(b'\n{')
+                tail = chunk[-1:]
+        return count
+
+    def open_records_file(self):
+        """Open the JSON records sidecar for appending, rebuilding it if it does not match the CSV"""
+        if self._records_fh is not None:
+            self._records_fh.close()
+            self._records_fh = None
+        if self._csv_fh is not None:
+            self._csv_fh.flush()
+        
+        expected = self._csv_record_count
+        if not os.path.exists(self.records_file) or self.count_json_records() != expected:
+            if os.path.exists(self.records_file):
+                self.logger.warning("⚠️ JSON records sidecar does not match the CSV, rebuilding it")
+            with open(self.records_file, "wb", buffering=1 << 20) as file:
+                for written, item in enumerate(self.csv_records()):
+                    file.write((b",\n" if written else b"") + orjson.dumps(item, option=orjson.OPT_INDENT_2))
+        
+        self._records_fh = open(self.records_file, "ab")
+        self._json_record_count = expected
+
+    def write_json_record(self, item: Dict[str, str]):
+        """Queue one record for the sidecar, formatted as an element of the final JSON array"""
+        if self._records_fh is not None:
+            self._pending_records.append(orjson.dumps(item, option=orjson.OPT_INDENT_2))
+
+    def write_pending_sidecars(self):
+        """Append the queued ASINs and records to their sidecars; only call once the CSV rows are on disk"""
+        if self._asins_fh is not None and self._pending_asins:
+            self._asins_fh.write("".join(f"{asin}\n" for asin in self._pending_asins))
+            self._asins_fh.flush()
+        self._pending_asins.clear()
+        
+        if self._records_fh is not None and self._pending_records:
+            separator = b",\n" if self._records_fh.tell() else b""
+            self._records_fh.write(separator + b",\n".join(self._pending_records))
+            self._records_fh.flush()
+            self._json_record_count += len(self._pending_records)
+        self._pending_records.clear()
+
     def convert_csv_to_json(self) -> ScrapingResult:
         """Convert CSV data to JSON format"""
         try:
             if not os.path.exists(self.csv_file):
                 return ScrapingResult(StatusCode.NOT_FOUND, "CSV file not found")
             
-            fields = [
-                "timestamp", "asin", "title", "price", "original_price",
-                "rating", "review_count", "image_url", "product_url",
-                "best_seller", "delivery_info", "page_number", "scraped_successfully"
-            ]
-            
-            json_data = []
-            with open(self.csv_file, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get("scraped_successfully") == "YES":
-                        # Re-map into clean structure
-                        item = {field: row.get(field, "") for field in fields}
-                        json_data.append(item)
-
-            with open(self.json_file, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, indent=4, ensure_ascii=False)
+            # Make sure buffered rows are on disk before re-reading them
+            self.flush_outputs()
+            
+            converted = 0
+            with open(self.json_file, "wb", buffering=1 << 20) as dst:
+                dst.write(b"[\n")
+                if self._records_fh is not None:
+                    # Every saved row is already serialized in the sidecar; copy it through, re-checking
+                    # it against the CSV first only if the running counts have drifted apart
+                    if self._json_record_count != self._csv_record_count:
+                        self.open_records_file()
+                    converted = self._json_record_count
+                    with open(self.records_file, "rb") as src:
+                        shutil.copyfileobj(src, dst, 1 << 20)
+                else:
+                    # No sidecar this run: stream rows straight into the JSON array
+                    for item in self.csv_records():
+                        dst.write((b",\n" if converted else b"") + orjson.dumps(item, option=orjson.OPT_INDENT_2))
+                        converted += 1
+                dst.write(b"\n]\n")
 
-            log_msg = f"📝 Converted {len(json_data)} records to JSON: {self.json_file}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            self.logger.info("📝 Converted %s records to JSON: %s", converted, self.json_file)
 
             return ScrapingResult(
                 StatusCode.SUCCESS,
-                f"Converted {len(json_data)} records to JSON: {self.json_file}"
+                f"Converted {converted} records to JSON: {self.json_file}"
             )
         except Exception as e:
-            error_msg = f"Failed to convert CSV to JSON: {str(e)}"
-            self.logger.error(error_msg)
-            self.add_job_log(f"❌ {error_msg}")
+            self.logger.error("❌ Failed to convert CSV to JSON: %s", e)
             return ScrapingResult(StatusCode.ERROR, "Failed to convert CSV to JSON", error_details=str(e))
 
     def get_scraped_asins(self) -> ScrapingResult:
         """Get set of already scraped ASINs"""
         try:
             scraped_asins = set()
-            if os.path.exists(self.csv_file):
-                with open(self.csv_file, 'r', encoding='utf-8') as file:
-                    reader = csv.DictReader(file)
-                    for row in reader:
-                        if row.get('asin') and row.get('scraped_successfully') == 'YES':
-                            scraped_asins.add(row['asin'])
+            if self._csv_fh is not None:
+                self._csv_fh.flush()
+            if self._csv_record_count is not None:
+                expected = self._csv_record_count
+            else:
+                expected = self.count_scraped_records() if os.path.exists(self.csv_file) else 0
+            
+            sidecar_asins = None
+            if os.path.exists(self.asins_file):
+                # Fast path: the sidecar holds one line per saved row, trusted only while it matches the CSV
+                with open(self.asins_file, 'r', encoding='utf-8') as file:
+                    sidecar_asins = file.read().split()
+                if len(sidecar_asins) != expected:
+                    self.logger.warning("⚠️ ASIN sidecar does not match the CSV, rescanning the CSV")
+                    sidecar_asins = None
+            
+            if sidecar_asins is not None:
+                scraped_asins.update(sidecar_asins)
+            elif os.path.exists(self.csv_file):
+                row_asins = []
+                with open(self.csv_file, 'r', newline='', encoding='utf-8', buffering=1 << 20) as file:
+                    reader = csv.reader(file)
+                    header = next(reader, [])
+                    if 'asin' in header and 'scraped_successfully' in header:
+                        asin_index = header.index('asin')
+                        status_index = header.index('scraped_successfully')
+                        row_asins = [
+                            row[asin_index] for row in reader
+                            if len(row) > status_index and row[status_index] == 'YES' and row[asin_index]
+                        ]
+                scraped_asins.update(row_asins)
+                
+                # Build the sidecar so the next run can skip the CSV scan
+                with open(self.asins_file, 'w', encoding='utf-8') as file:
+                    file.writelines(f"{asin}\n" for asin in row_asins)
             
+            self._asins_fh = open(self.asins_file, 'a', encoding='utf-8')
             self.scraped_asins = scraped_asins
-            log_msg = f"📋 Found {len(scraped_asins)} already scraped products"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            self.logger.info("📋 Found %s already scraped products", len(scraped_asins))
             return ScrapingResult(StatusCode.SUCCESS, f"Found {len(scraped_asins)} already scraped products", 
                                 data={'scraped_asins': scraped_asins})
         except Exception as e:
-            error_msg = f"Failed to get scraped ASINs: {str(e)}"
-            self.logger.error(error_msg)
-            self.add_job_log(f"❌ {error_msg}")
+            self.logger.error("❌ Failed to get scraped ASINs: %s", e)
             return ScrapingResult(StatusCode.ERROR, "Failed to get scraped ASINs", error_details=str(e))
 
+    def count_scraped_records(self) -> int:
+        """Count successful rows with a raw byte scan instead of parsing the CSV"""
+        marker = b',YES\r\n'
+        with open(self.csv_file, 'rb') as file:
+            header = file.readline().rstrip(b'\r\n').decode('utf-8').split(',')
+            
+            # Our own files end every row with ',YES\r\n' since 'scraped_successfully' is last.
+            # Scan fixed-size chunks, carrying a short tail so no marker is split, to keep
+            # memory flat however large the CSV grows
+            if header[-1:] == ['scraped_successfully']:
+                count = 0
+                tail = b''
+                while chunk := file.read(1 << 20):
+                    data = tail + chunk
+                    count += data.count(marker)
+                    tail = data[1 - len(marker):]
+                return count
+            
+            # Any other layout: parse rows as tuples and check the status column by position
+            file.seek(0)
+            reader = csv.reader(io.TextIOWrapper(file, encoding='utf-8', newline=''))
+            header = next(reader, [])
+            if 'scraped_successfully' not in header:
+                return 0
+            status_index = header.index('scraped_successfully')
+            return sum(1 for row in reader if len(row) > status_index and row[status_index] == 'YES')
+
+    def flush_outputs(self):
+        """Write buffered CSV rows and the pending progress state in one batch"""
+        if self._csv_fh is not None:
+            self._csv_fh.flush()
+        self.write_pending_sidecars()
+        self.flush_log_file()
+        
+        if self._pending_progress is None:
+            return
+        
+        # Replace the file atomically so a crash never leaves a half-written snapshot
+        temp_file = f"{self.progress_file}.tmp"
+        with open(temp_file, 'wb') as file:
+            file.write(self._pending_progress)
+        os.replace(temp_file, self.progress_file)
+        self._pending_progress = None
+
     def save_progress(self, current_index: int, total_products: int, page_number: int) -> ScrapingResult:
         """Save current scraping progress to JSON"""
         try:
+            # Mid-page saves are rate limited; the end-of-page save always goes through
+            now = time.monotonic()
+            if current_index < total_products and now - self._last_progress_save < PROGRESS_MIN_INTERVAL:
+                return ScrapingResult(StatusCode.SUCCESS, "Progress save skipped, last one was too recent")
+            self._last_progress_save = now
+            
             progress_data = {
                 'current_index': current_index,
                 'total_products': total_products,
                 'page_number': page_number,
                 'session_scraped': self.session_scraped,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._now_strings()[1]
             }
             
-            with open(self.progress_file, 'w') as file:
-                json.dump(progress_data, file, indent=2)
+            # The snapshot reaches disk together with the CSV rows it describes
+            self._pending_progress = orjson.dumps(progress_data, option=orjson.OPT_INDENT_2)
+            self.flush_outputs()
                 
             # Update progress via API
             percentage = (current_index / total_products) * 100 if total_products > 0 else 0
@@ -446,191 +918,152 @@ class EnhancedAmazonScraper:
         except Exception as e:
             return ScrapingResult(StatusCode.ERROR, "Failed to save progress", error_details=str(e))
 
-    def safe_get_text(self, element, selector: str) -> str:
-        """Safely extract text from element"""
-        try:
-            sub_element = element.find_element(By.CSS_SELECTOR, selector)
-            return sub_element.text.strip()
-        except NoSuchElementException:
-            return ""
+    def safe_get_text(self, element, selectors) -> str:
+        """Return the first non-empty text among the selectors, in priority order"""
+        if isinstance(selectors, str):
+            selectors = (selectors,)
+        for selector in selectors:
+            matches = compiled_selector(selector)(element)
+            # Collapse whitespace runs the way a browser renders them; text_content() also
+            # includes hidden descendants, unlike Selenium's visible-only .text
+            text = " ".join(matches[0].text_content().split()) if matches else ""
+            if text:
+                return text
+        return ""
 
-    def safe_get_attribute(self, element, selector: str, attribute: str) -> str:
-        """Safely extract attribute from element"""
-        try:
-            sub_element = element.find_element(By.CSS_SELECTOR, selector)
-            return sub_element.get_attribute(attribute) or ""
-        except NoSuchElementException:
-            return ""
+    def safe_get_attribute(self, element, selectors, attribute: str) -> str:
+        """Return the first non-empty attribute value among the selectors, in priority order"""
+        if isinstance(selectors, str):
+            selectors = (selectors,)
+        for selector in selectors:
+            matches = compiled_selector(selector)(element)
+            value = (matches[0].get(attribute) or "") if matches else ""
+            if value:
+                return value
+        return ""
+
+    def get_page_products(self) -> List:
+        """Snapshot the results page once and parse its product cards in-process"""
+        if self.use_http:
+            source = self._page_html
+        else:
+            # One script call returns just the cards' markup, not the whole page
+            source = f"<div>{self.browser.execute_script(CARD_HTML_JS, PRODUCT_CARD_SELECTOR)}</div>"
+        
+        # A retried page usually serves the same markup; reuse the cards parsed from it
+        if self._parsed_page is not None and self._parsed_page[0] == source:
+            return self._parsed_page[1]
+        products = compiled_selector(PRODUCT_CARD_SELECTOR)(lxml_html.fromstring(source))
+        self._parsed_page = (source, products)
+        return products
 
     def extract_product_data(self, product_element, product_num: int, page_number: int) -> ScrapingResult:
         """Extract comprehensive product data with status reporting"""
         try:
-            log_msg = f"--- Extracting Product {product_num} (Page {page_number}) ---"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            # Collect this product's log lines and emit them as one record at the end
+            log_lines = [f"--- Extracting Product {product_num} (Page {page_number}) ---"]
             
-            product_data = {}
+            product_data = Product()
             
             # Extract ASIN
-            asin = product_element.get_attribute('data-asin') or ""
-            product_data['asin'] = asin
+            asin = product_element.get('data-asin') or ""
+            product_data.asin = asin
             
             if not asin:
                 return ScrapingResult(StatusCode.NOT_FOUND, "ASIN not found")
-            
-            if asin in self.scraped_asins:
-                return ScrapingResult(StatusCode.ALREADY_EXISTS, f"ASIN {asin} already scraped")
 
             # Construct clean product URL
             product_url = f"https://www.amazon.in/dp/{asin}?th=1"
-            product_data['product_url'] = product_url
+            product_data.product_url = product_url
             
             # Extract title
-            title_selectors = ["h2 span", "h2 a span", "[data-cy='title-recipe'] span"]
-            title = ""
-            for selector in title_selectors:
-                title = self.safe_get_text(product_element, selector)
-                if title:
-                    break
-            
-            product_data['title'] = title
+            title = self.safe_get_text(product_element, TITLE_SELECTORS)
+            product_data.title = title
             
             # Extract price
-            price_selectors = [".a-price-whole", ".a-price .a-offscreen", ".a-price-range .a-price .a-offscreen"]
-            price = ""
-            for selector in price_selectors:
-                price = self.safe_get_text(product_element, selector)
-                if price and price.strip():
-                    break
-            
-            product_data['price'] = price
-            log_msg = f"💰 Current Price: {price}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
-            
-            html = product_element.get_attribute("innerHTML")
-
-            mrp_matches = re.search(
-                r'<span[^>]*class="[^"]*a-text-price[^"]*"[^>]*>\s*<span[^>]*class="[^"]*a-offscreen[^"]*"[^>]*>(₹[\d,]+)</span>',
-                html
-            )
-            original_price = mrp_matches.group(1) if mrp_matches else ""
-            product_data['original_price'] = original_price
-            log_msg = f"🏷️ Original Price (MRP): {original_price}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            price = self.safe_get_text(product_element, PRICE_SELECTORS)
+            product_data.price = price
+            log_lines.append(f"💰 Current Price: {price}")
+            
+            # Extract MRP (the struck-through price)
+            mrp_text = self.safe_get_text(product_element, MRP_SELECTOR)
+            mrp_matches = MRP_RE.fullmatch(mrp_text)
+            original_price = mrp_matches.group(0) if mrp_matches else ""
+            product_data.original_price = original_price
+            log_lines.append(f"🏷️ Original Price (MRP): {original_price}")
 
             # Extract rating
-            rating_match = re.search(r'([\d.]+)\s*out of 5 stars', html)
+            rating_match = RATING_RE.match(self.safe_get_text(product_element, RATING_SELECTORS))
             rating = rating_match.group(1) if rating_match else ""
-            product_data['rating'] = rating
-            log_msg = f"⭐ Rating: {rating}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            product_data.rating = rating
+            log_lines.append(f"⭐ Rating: {rating}")
             
             # Extract review count
-            review_selectors = ["a[aria-label*='ratings'] span", ".a-size-base.s-underline-text"]
             review_count = ""
-            for selector in review_selectors:
+            for selector in REVIEW_SELECTORS:
                 review_count = self.safe_get_text(product_element, selector)
-                if review_count and review_count.replace(',', '').isdigit():
+                if REVIEW_COUNT_RE.fullmatch(review_count):
                     break
             
-            product_data['review_count'] = review_count
+            product_data.review_count = review_count
             
             # Extract image URL
-            image_selectors = [".s-image", "img[data-image-index]"]
-            image_url = ""
-            for selector in image_selectors:
-                image_url = self.safe_get_attribute(product_element, selector, 'src')
-                if image_url:
-                    break
-            
-            product_data['image_url'] = image_url
+            image_url = self.safe_get_attribute(product_element, IMAGE_SELECTORS, 'src')
+            product_data.image_url = image_url
             
             # Check for best seller badge
-            try:
-                badge_element = product_element.find_element(By.CSS_SELECTOR, ".a-badge-text")
-                product_data['best_seller'] = "YES" if "Best seller" in badge_element.text else "NO"
-            except NoSuchElementException:
-                product_data['best_seller'] = "NO"
+            badge_text = self.safe_get_text(product_element, BADGE_SELECTOR)
+            product_data.best_seller = "YES" if "Best seller" in badge_text else "NO"
             
             # Extract delivery info
-            delivery_selectors = [".udm-primary-delivery-message", "[data-cy='delivery-block']"]
-            delivery_info = ""
-            for selector in delivery_selectors:
-                delivery_info = self.safe_get_text(product_element, selector)
-                if delivery_info:
-                    break
-            
-            product_data['delivery_info'] = delivery_info
+            delivery_info = self.safe_get_text(product_element, DELIVERY_SELECTORS)
+            product_data.delivery_info = delivery_info
             
             # Log extracted data summary
             title_display = title[:50] + "..." if len(title) > 50 else title
-            log_msg = f"✓ ASIN: {asin}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
-            log_msg = f"✓ Title: {title_display}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
-            log_msg = f"✓ Price: {price}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            log_lines.append(f"✓ ASIN: {asin}")
+            log_lines.append(f"✓ Title: {title_display}")
+            log_lines.append(f"✓ Price: {price}")
+            self.logger.info("\n".join(log_lines))
             
             return ScrapingResult(StatusCode.SUCCESS, f"Successfully extracted product {product_num}", data=product_data)
             
         except Exception as e:
-            error_msg = f"Failed to extract product {product_num}: {str(e)}"
-            self.logger.error(error_msg)
-            self.add_job_log(f"❌ {error_msg}")
+            self.logger.error("❌ Failed to extract product %s: %s", product_num, e)
             return ScrapingResult(StatusCode.ERROR, f"Failed to extract product {product_num}", error_details=str(e))
 
     def go_to_next_page(self) -> ScrapingResult:
         """Navigate to next page with enhanced delay and error handling"""
         try:
-            log_msg = f"➡️ Attempting to navigate to page {self.current_page + 1}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
-            
-            # Add pagination delay BEFORE attempting navigation
-            self.pagination_delay(self.current_page + 1)
-            
-            # Find next button
-            next_button = WebDriverWait(self.browser, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "a.s-pagination-next"))
-            )
-            
-            # Scroll to button with human-like behavior
-            self.browser.execute_script("arguments[0].scrollIntoView({behavior: 'smooth'});", next_button)
-            self.random_delay(2, 4)
+            self.logger.info("➡️ Attempting to navigate to page %s", self.current_page + 1)
             
-            # Click with JavaScript to avoid interception
-            self.browser.execute_script("arguments[0].click();", next_button)
+            # Keep a politeness floor between result page requests (a prefetch already waited)
+            if not (self.use_http and self._prefetch is not None):
+                self.random_delay(*POLITENESS_DELAY)
             
-            # Wait for page load
-            WebDriverWait(self.browser, 20).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-component-type='s-search-result']"))
-            )
+            if self.use_http:
+                load_result = self.load_search_page_http(self.current_page + 1)
+                if load_result.status_code != StatusCode.SUCCESS:
+                    return load_result
+            else:
+                # Open the next results page directly instead of finding and clicking "Next"
+                self.browser.get(self.build_search_url(self.current_page + 1))
+                WebDriverWait(self.browser, 20).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR))
+                )
             
             self.current_page += 1
-            self.random_delay(3, 6)
             
-            log_msg = f"✅ Successfully navigated to page {self.current_page}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            self.logger.info("✅ Successfully navigated to page %s", self.current_page)
             
             return ScrapingResult(StatusCode.SUCCESS, f"Successfully navigated to page {self.current_page}")
             
         except (TimeoutException, NoSuchElementException) as e:
-            error_msg = "Next page button not found or navigation failed"
-            self.logger.warning(error_msg)
-            self.add_job_log(f"⚠️ {error_msg}")
-            return ScrapingResult(StatusCode.NOT_FOUND, "Next page button not found or navigation failed", 
+            self.logger.warning("⚠️ Next page has no results or navigation failed")
+            return ScrapingResult(StatusCode.NOT_FOUND, "Next page has no results or navigation failed", 
                                 error_details=str(e))
         except Exception as e:
-            error_msg = f"Navigation error: {str(e)}"
-            self.logger.error(error_msg)
-            self.add_job_log(f"❌ {error_msg}")
+            self.logger.error("❌ Navigation error: %s", e)
             return ScrapingResult(StatusCode.ERROR, "Navigation error", error_details=str(e))
 
     def search_products(self, search_term: str) -> ScrapingResult:
@@ -638,66 +1071,70 @@ class EnhancedAmazonScraper:
         try:
             if not search_term:
                 search_term = "laptop"  # default if user enters nothing
+            self.search_term = search_term
+            
+            if self.use_http:
+                self.logger.info("🔍 Searching for: %s (HTTP)", search_term)
+                load_result = self.load_search_page_http(1)
+                if load_result.status_code != StatusCode.SUCCESS:
+                    return ScrapingResult(StatusCode.ERROR, "Search failed", error_details=load_result.message)
+                
+                self.logger.info("✅ Successfully searched for '%s'", search_term)
+                return ScrapingResult(StatusCode.SUCCESS, f"Successfully searched for '{search_term}'")
 
-            log_msg = "🌐 Opening Amazon India..."
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            self.logger.info("🌐 Opening Amazon India...")
             self.browser.get("https://www.amazon.in/")
-            self.random_delay(3, 5)
+            search_box = WebDriverWait(self.browser, 15).until(
+                EC.presence_of_element_located((By.ID, "twotabsearchtextbox"))
+            )
             
             # Handle potential popups/cookies
             try:
                 cookie_button = self.browser.find_element(By.ID, "sp-cc-accept")
                 cookie_button.click()
-                self.random_delay(1, 2)
             except NoSuchElementException:
                 pass
             
-            log_msg = f"🔍 Searching for: {search_term}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
-            search_box = self.browser.find_element(By.ID, "twotabsearchtextbox")
+            self.logger.info("🔍 Searching for: %s", search_term)
             
-            # Human-like typing
-            self.human_like_typing(search_box, search_term)
-            self.random_delay(1, 3)
+            # Enter the whole term at once, then a short pause before submitting
+            search_box.clear()
+            search_box.send_keys(search_term)
+            time.sleep(random.uniform(0.3, 0.7))
             
             # Submit search
             search_box.submit()
-            self.random_delay(4, 7)
             
             # Wait for results
             WebDriverWait(self.browser, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-component-type='s-search-result']"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR))
             )
             
-            log_msg = f"✅ Successfully searched for '{search_term}'"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            self.logger.info("✅ Successfully searched for '%s'", search_term)
             
             return ScrapingResult(StatusCode.SUCCESS, f"Successfully searched for '{search_term}'")
             
         except Exception as e:
-            error_msg = f"Search failed: {str(e)}"
-            self.logger.error(error_msg)
-            self.add_job_log(f"❌ {error_msg}")
+            self.logger.error("❌ Search failed: %s", e)
             return ScrapingResult(StatusCode.ERROR, "Search failed", error_details=str(e))
 
     def display_bold_summary(self, total_scraped: int, pages_scraped: int):
         """Display a bold summary message"""
-        summary = f"""
-{"="*70}
-🎯{"═" * 64}🎯
-{"="*70}
-   📦 Product: {self.product_name.upper() if self.product_name else 'GENERAL'}
-   ✅ Products Scraped: {total_scraped}
-   📄 Pages Processed: {pages_scraped}
-   💾 CSV File: {os.path.abspath(self.csv_file)}
-   📝 JSON File: {os.path.abspath(self.json_file)}
-{"="*70}
-   🎉 SCRAPING COMPLETED SUCCESSFULLY! 🎉
-{"="*70}
-"""
+        summary = "\n".join((
+            "",
+            SUMMARY_RULE,
+            SUMMARY_BANNER,
+            SUMMARY_RULE,
+            f"   📦 Product: {self.product_name.upper() if self.product_name else 'GENERAL'}",
+            f"   ✅ Products Scraped: {total_scraped}",
+            f"   📄 Pages Processed: {pages_scraped}",
+            f"   💾 CSV File: {self.csv_file}",
+            f"   📝 JSON File: {self.json_file}",
+            SUMMARY_RULE,
+            "   🎉 SCRAPING COMPLETED SUCCESSFULLY! 🎉",
+            SUMMARY_RULE,
+            "",
+        ))
         print(summary)
         self.add_job_log(summary)
 
@@ -706,28 +1143,26 @@ class EnhancedAmazonScraper:
         # Set product name and file paths
         self.set_product_name(product_name)
         
-        log_msg = "🚀 Starting Enhanced Amazon Scraper"
-        self.logger.info(log_msg)
-        self.add_job_log(log_msg)
-        self.logger.info("=" * 60)
+        self.logger.info("🚀 Starting Enhanced Amazon Scraper")
+        self.logger.info("=" * 60, extra=NO_JOB_LOG)
         
         # Update job status to running
         self.update_job_status('running', f'Starting scraping for "{product_name}"')
         
-        # Initialize browser
-        result = self.initialize_browser()
+        # Initialize browser (or the HTTP session in browserless mode)
+        result = self.initialize_http_session() if self.use_http else self.initialize_browser()
         if result.status_code != StatusCode.SUCCESS:
-            self.update_job_status('failed', 'Failed to initialize browser', result.error_details)
+            self.update_job_status('failed', result.message, result.error_details)
             return result
         
         try:
             # Initialize CSV
             csv_result = self.initialize_csv()
-            self.logger.info(f"📄 CSV Status: {csv_result.message}")
+            self.logger.info("📄 CSV Status: %s", csv_result.message, extra=NO_JOB_LOG)
             
             # Load existing scraped ASINs
             asins_result = self.get_scraped_asins()
-            self.logger.info(f"📋 ASINs Status: {asins_result.message}")
+            self.logger.info("📋 ASINs Status: %s", asins_result.message, extra=NO_JOB_LOG)
             
             # Search for products
             search_result = self.search_products(product_name)
@@ -737,19 +1172,35 @@ class EnhancedAmazonScraper:
             
             pages_scraped = 0
             total_session_scraped = 0
+            page_failures = 0
             
             while pages_scraped < max_pages and total_session_scraped < max_products_per_session:
                 try:
-                    # Get products on current page
-                    products = self.browser.find_elements(By.CSS_SELECTOR, "div[data-component-type='s-search-result']")
-                    log_msg = f"📦 Found {len(products)} products on page {self.current_page}"
-                    self.logger.info(log_msg)
-                    self.add_job_log(log_msg)
+                    # Get every product on the current page from a single page_source snapshot
+                    products = self.get_page_products()
+                    self.logger.info("📦 Found %s products on page %s", len(products), self.current_page)
+                    
+                    # Overlap the next page's fetch with processing this one, unless this
+                    # page alone has enough new products to fill the remaining quota
+                    if pages_scraped + 1 < max_pages:
+                        new_products = sum(1 for product in products
+                                           if (asin := product.get('data-asin')) and asin not in self.scraped_asins)
+                        if new_products < max_products_per_session - total_session_scraped:
+                            self.prefetch_search_page(self.current_page + 1)
                     
                     page_scraped = 0
+                    page_skipped = 0
                     for i, product in enumerate(products):
                         if total_session_scraped >= max_products_per_session:
                             break
+                        
+                        # Skip placeholder cards and already scraped products before any further work
+                        asin = product.get('data-asin')
+                        if not asin:
+                            continue
+                        if asin in self.scraped_asins:
+                            page_skipped += 1
+                            continue
                             
                         # Extract product data
                         extract_result = self.extract_product_data(product, i + 1, self.current_page)
@@ -759,74 +1210,62 @@ class EnhancedAmazonScraper:
                             csv_save_result = self.save_to_csv(extract_result.data, self.current_page)
                             
                             if csv_save_result.status_code == StatusCode.SUCCESS:
-                                self.scraped_asins.add(extract_result.data['asin'])
                                 total_session_scraped += 1
                                 page_scraped += 1
                                 
-                                log_msg = f"✅ [{extract_result.status_code.value}] {csv_save_result.message}"
-                                self.logger.info(log_msg)
-                                self.add_job_log(log_msg)
+                                self.logger.info("✅ [%s] %s", extract_result.status_code.value, csv_save_result.message)
                                 
-                                # Save progress
-                                progress_save = self.save_progress(i, len(products), self.current_page)
+                                # Save progress every few rows rather than after each one
+                                if total_session_scraped % PROGRESS_SAVE_EVERY == 0:
+                                    self.save_progress(i, len(products), self.current_page)
                                 
                             else:
-                                error_msg = f"❌ [{csv_save_result.status_code.value}] {csv_save_result.message}"
-                                self.logger.error(error_msg)
-                                self.add_job_log(error_msg)
+                                self.logger.error("❌ [%s] %s", csv_save_result.status_code.value, csv_save_result.message)
                         
-                        elif extract_result.status_code == StatusCode.ALREADY_EXISTS:
-                            log_msg = f"⏭️ [{extract_result.status_code.value}] {extract_result.message}"
-                            self.logger.info(log_msg)
-                            self.add_job_log(log_msg)
                         else:
-                            warn_msg = f"⚠️ [{extract_result.status_code.value}] {extract_result.message}"
-                            self.logger.warning(warn_msg)
-                            self.add_job_log(warn_msg)
-                        
-                        # Random delay between products
-                        self.random_delay(2, 5)
+                            self.logger.warning("⚠️ [%s] %s", extract_result.status_code.value, extract_result.message)
+                    
+                    if page_skipped:
+                        self.logger.info("⏭️ [%s] Skipped %s already scraped products on page %s",
+                                         StatusCode.ALREADY_EXISTS.value, page_skipped, self.current_page)
                     
-                    log_msg = f"📊 Page {self.current_page} completed: {page_scraped} products scraped"
-                    self.logger.info(log_msg)
-                    self.add_job_log(log_msg)
+                    if page_scraped:
+                        self.save_progress(len(products), len(products), self.current_page)
+                    
+                    self.logger.info("📊 Page %s completed: %s products scraped", self.current_page, page_scraped)
+                    self.end_job_log_batch()
+                    self.flush_log_file()
                     pages_scraped += 1
+                    page_failures = 0
                     
                     # Try to go to next page
                     if pages_scraped < max_pages and total_session_scraped < max_products_per_session:
                         next_page_result = self.go_to_next_page()
                         if next_page_result.status_code != StatusCode.SUCCESS:
-                            warn_msg = f"🛑 [{next_page_result.status_code.value}] {next_page_result.message}"
-                            self.logger.warning(warn_msg)
-                            self.add_job_log(warn_msg)
+                            self.logger.warning("🛑 [%s] %s", next_page_result.status_code.value, next_page_result.message)
                             break
                         else:
-                            log_msg = f"✅ [{next_page_result.status_code.value}] {next_page_result.message}"
-                            self.logger.info(log_msg)
-                            self.add_job_log(log_msg)
+                            self.logger.info("✅ [%s] %s", next_page_result.status_code.value, next_page_result.message)
                     
                 except Exception as e:
-                    error_msg = f"❌ [500] Error on page {self.current_page}: {str(e)}"
-                    self.logger.error(error_msg)
-                    self.add_job_log(error_msg)
+                    self.logger.error("❌ [500] Error on page %s: %s", self.current_page, e)
+                    self.end_job_log_batch()
+                    # Get the rows this page did save onto disk before retrying it
+                    self.flush_outputs()
+                    page_failures += 1
+                    if page_failures >= PAGE_RETRY_LIMIT:
+                        self.logger.warning("🛑 Giving up on page %s after %s failed attempts", self.current_page, page_failures)
+                        break
                     continue
             
             # Convert CSV to JSON
             json_result = self.convert_csv_to_json()
-            log_msg = f"📝 [{json_result.status_code.value}] {json_result.message}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            self.logger.info("📝 [%s] %s", json_result.status_code.value, json_result.message)
             
             # Log session summary
-            log_msg = "🎉 SESSION COMPLETED SUCCESSFULLY!"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
-            log_msg = f"📊 Total products scraped: {total_session_scraped}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
-            log_msg = f"📄 Pages processed: {pages_scraped}"
-            self.logger.info(log_msg)
-            self.add_job_log(log_msg)
+            self.logger.info("🎉 SESSION COMPLETED SUCCESSFULLY!")
+            self.logger.info("📊 Total products scraped: %s", total_session_scraped)
+            self.logger.info("📄 Pages processed: %s", pages_scraped)
             
             # Display bold summary
             self.display_bold_summary(total_session_scraped, pages_scraped)
@@ -839,9 +1278,7 @@ class EnhancedAmazonScraper:
                                 data={'total_scraped': total_session_scraped, 'pages_scraped': pages_scraped})
             
         except Exception as e:
-            error_msg = f"❌ [500] Scraper execution failed: {str(e)}"
-            self.logger.error(error_msg)
-            self.add_job_log(error_msg)
+            self.logger.error("❌ [500] Scraper execution failed: %s", e)
             self.update_job_status('failed', 'Scraper execution failed', str(e))
             return ScrapingResult(StatusCode.ERROR, "Scraper execution failed", error_details=str(e))
         
@@ -851,71 +1288,98 @@ class EnhancedAmazonScraper:
 
     def cleanup(self):
         """Cleanup resources and temporary files with robust error handling"""
-        try:
-            # Close browser with multiple fallback methods
-            if self.browser:
-                try:
-                    # Try graceful quit first
-                    self.browser.quit()
-                    log_msg = "🔚 Browser closed gracefully"
-                    self.logger.info(log_msg)
-                    self.add_job_log(log_msg)
-                except Exception as e:
+        # run_scraper cleans up in its finally block and main() calls this again afterwards
+        if self._cleaned:
+            return
+        self._cleaned = True
+        # Close browser with multiple fallback methods
+        if self.browser:
+            try:
+                # Try graceful quit first; for an attached browser this only ends the
+                # chromedriver session and leaves that Chrome running for the next job,
+                # so close this job's own tab first
+                if self.attach_port:
                     try:
-                        # If quit fails, try to close
                         self.browser.close()
-                        log_msg = "🔚 Browser closed forcefully"
-                        self.logger.info(log_msg)
-                        self.add_job_log(log_msg)
-                    except Exception as e2:
-                        # If both fail, just log and continue
-                        warn_msg = f"⚠️ Browser cleanup issue (this is normal): {str(e2)[:100]}"
-                        self.logger.warning(warn_msg)
-                        self.add_job_log(warn_msg)
-                finally:
-                    # Set browser to None to prevent further attempts
-                    self.browser = None
-            
-            # Clean up progress file
-            try:
-                if os.path.exists(self.progress_file):
-                    os.remove(self.progress_file)
-                    log_msg = "🗑️ Progress file cleaned up"
-                    self.logger.info(log_msg)
-                    self.add_job_log(log_msg)
+                    except Exception as e:
+                        self.logger.warning("⚠️ Could not close the job's browser tab: %s", str(e)[:100])
+                self.browser.quit()
+                self.logger.info("🔚 Browser closed gracefully")
             except Exception as e:
-                warn_msg = f"⚠️ Could not remove progress file: {str(e)}"
-                self.logger.warning(warn_msg)
-                self.add_job_log(warn_msg)
+                try:
+                    # If quit fails, try to close
+                    self.browser.close()
+                    self.logger.info("🔚 Browser closed forcefully")
+                except Exception as e2:
+                    # If both fail, just log and continue
+                    self.logger.warning("⚠️ Browser cleanup issue (this is normal): %s", str(e2)[:100])
+            finally:
+                # Set browser to None to prevent further attempts
+                self.browser = None
+        
+        # Stop the page prefetcher without waiting out its politeness delay
+        try:
+            if self._prefetch_pool is not None:
+                self._prefetch_stop.set()
+                self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+            if self.http_session is not None:
+                self.http_session.close()
+        except Exception as e:
+            self.logger.warning("⚠️ Could not close HTTP session: %s", e)
+        finally:
+            self._prefetch_pool = None
+            self._prefetch = None
+            self.http_session = None
+        
+        # Close the CSV handle so every buffered row is written
+        try:
+            self.close_csv()
+        except Exception as e:
+            self.logger.warning("⚠️ Could not close CSV file: %s", e)
+        
+        # Clean up progress file
+        try:
+            os.remove(self.progress_file)
+            self.logger.info("🗑️ Progress file cleaned up")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning("⚠️ Could not remove progress file: %s", e)
+            
+        # Show final statistics
+        try:
+            # The running row count already matches the CSV, so only scan it
+            # when the run stopped before the CSV was opened
+            if self._csv_record_count is not None:
+                total_records = self._csv_record_count
+            else:
+                total_records = self.count_scraped_records()
+            self.logger.info("📈 Total products in database: %s", total_records)
                 
-            # Show final statistics
+            # Show file locations
+            self.logger.info("📄 CSV file saved: %s", self.csv_file)
+            json_file = None
             try:
-                if os.path.exists(self.csv_file):
-                    with open(self.csv_file, 'r', encoding='utf-8') as file:
-                        reader = csv.DictReader(file)
-                        total_records = sum(1 for row in reader if row.get('scraped_successfully') == 'YES')
-                        log_msg = f"📈 Total products in database: {total_records}"
-                        self.logger.info(log_msg)
-                        self.add_job_log(log_msg)
-                        
-                    # Show file locations
-                    log_msg = f"📄 CSV file saved: {os.path.abspath(self.csv_file)}"
-                    self.logger.info(log_msg)
-                    self.add_job_log(log_msg)
-                    if os.path.exists(self.json_file):
-                        log_msg = f"📝 JSON file saved: {os.path.abspath(self.json_file)}"
-                        self.logger.info(log_msg)
-                        self.add_job_log(log_msg)
-                        
-            except Exception as e:
-                warn_msg = f"⚠️ Could not read final statistics: {str(e)}"
-                self.logger.warning(warn_msg)
-                self.add_job_log(warn_msg)
+                json_size = os.stat(self.json_file).st_size
+                self.logger.info("📝 JSON file saved: %s (%s bytes)", self.json_file, f"{json_size:,}")
+                json_file = self.json_file
+            except FileNotFoundError:
+                pass
+            
+            # Kept for the CLI summary, which runs after cleanup
+            self.result_summary = {
+                'total_records': total_records,
+                'csv_file': self.csv_file,
+                'json_file': json_file
+            }
                 
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            error_msg = f"❌ Cleanup error: {str(e)}"
-            self.logger.error(error_msg)
-            self.add_job_log(error_msg)
+            self.logger.warning("⚠️ Could not read final statistics: %s", e)
+        
+        # Last step, so the messages above still reach the API
+        self.stop_api_worker()
 
 
 def main():
@@ -927,19 +1391,26 @@ def main():
     parser.add_argument('--job-id', help='Job ID for API integration')
     parser.add_argument('--headless', action='store_true', help='Run in headless mode')
     parser.add_argument('--enable-proxy', action='store_true', help='Enable proxy rotation')
+    parser.add_argument('--http', action='store_true',
+                        help='Fetch result pages over plain HTTP, falling back to the browser on a robot check')
+    parser.add_argument('--attach-port', type=int,
+                        help='Drive an already running Chrome started with --remote-debugging-port=PORT')
     
     args = parser.parse_args()
     
-    print("🚀 Enhanced Amazon Scraper with API Integration")
-    print("-" * 60)
-    print(f"📋 Configuration:")
-    print(f"   - Product: {args.product_name}")
-    print(f"   - Max Products: {args.max_products}")
-    print(f"   - Max Pages: {args.max_pages}")
-    print(f"   - Job ID: {args.job_id}")
-    print(f"   - Headless Mode: {args.headless}")
-    print(f"   - Proxy Enabled: {args.enable_proxy}")
-    print("-" * 60)
+    rule = "-" * 60
+    print(
+        f"🚀 Enhanced Amazon Scraper with API Integration\n{rule}\n"
+        f"📋 Configuration:\n"
+        f"   - Product: {args.product_name}\n"
+        f"   - Max Products: {args.max_products}\n"
+        f"   - Max Pages: {args.max_pages}\n"
+        f"   - Job ID: {args.job_id}\n"
+        f"   - Headless Mode: {args.headless}\n"
+        f"   - Proxy Enabled: {args.enable_proxy}\n"
+        f"   - HTTP Mode: {args.http}\n"
+        f"   - Attach Port: {args.attach_port}\n{rule}"
+    )
 
     scraper = None
 
@@ -947,7 +1418,9 @@ def main():
         scraper = EnhancedAmazonScraper(
             headless=args.headless, 
             enable_proxy=args.enable_proxy, 
-            job_id=args.job_id
+            job_id=args.job_id,
+            use_http=args.http,
+            attach_port=args.attach_port
         )
 
         print("\n🌐 Starting scraper...\n")
@@ -957,23 +1430,20 @@ def main():
             max_pages=args.max_pages
         )
 
-        print("\n🎯 Scraper Finished!")
-        print(f"   - Status: [{result.status_code.value}] {result.message}")
-        
+        summary = f"\n🎯 Scraper Finished!\n   - Status: [{result.status_code.value}] {result.message}"
         if result.data:
-            print(f"📊 Summary:")
-            print(f"   - Products Scraped: {result.data['total_scraped']}")
-            print(f"   - Pages Processed: {result.data['pages_scraped']}")
-        
-        # File locations
-        safe_name = args.product_name.replace(" ", "_").lower()
-        csv_file = os.path.join(scraper.csv_dir, f"{safe_name}.csv")
-        json_file = os.path.join(scraper.json_dir, f"{safe_name}.json")
+            summary += (
+                f"\n📊 Summary:"
+                f"\n   - Products Scraped: {result.data['total_scraped']}"
+                f"\n   - Pages Processed: {result.data['pages_scraped']}"
+            )
+        print(summary)
         
-        if os.path.exists(csv_file):
-            print(f"📄 CSV saved: {os.path.abspath(csv_file)}")
-        if os.path.exists(json_file):
-            print(f"📝 JSON saved: {os.path.abspath(json_file)}")
+        # File locations, as reported by cleanup()
+        if scraper.result_summary:
+            print(f"📄 CSV saved: {scraper.result_summary['csv_file']}")
+            if scraper.result_summary['json_file']:
+                print(f"📝 JSON saved: {scraper.result_summary['json_file']}")
         
         print("\n✅ Scraping completed successfully!")
         
@@ -1005,11 +1475,8 @@ def main():
 
 # Usage example for interactive mode
 if __name__ == "__main__":
-    # Check if running with command line arguments
-    if len(sys.argv) > 1:
-        main()
-    else:
-        # Interactive mode (original behavior)
+    # Without command line arguments, ask for the settings and run the same path as the CLI
+    if len(sys.argv) == 1:
         print("🚀 Welcome to the Enhanced Amazon Scraper!")
         print("You can configure the number of products to scrape and the maximum pages to navigate.")
         print("-" * 60)
@@ -1017,8 +1484,6 @@ if __name__ == "__main__":
         # Default settings
         DEFAULT_MAX_PRODUCTS = 5
         DEFAULT_MAX_PAGES = 1
-        HEADLESS_MODE = False
-        ENABLE_PROXY = False
 
         # Get user input with defaults
         try:
@@ -1034,55 +1499,8 @@ if __name__ == "__main__":
             MAX_PAGES = DEFAULT_MAX_PAGES
             product_name = "laptop"
 
-        print("\n📋 Configuration:")
-        print(f"   - Product: {product_name}")
-        print(f"   - Max Products: {MAX_PRODUCTS}")
-        print(f"   - Max Pages: {MAX_PAGES}")
-        print(f"   - Headless Mode: {HEADLESS_MODE}")
-        print(f"   - Proxy Enabled: {ENABLE_PROXY}")
-        print("-" * 60)
-
-        scraper = None
+        sys.argv += ["--product-name", product_name,
+                     "--max-products", str(MAX_PRODUCTS),
+                     "--max-pages", str(MAX_PAGES)]
 
-        try:
-            scraper = EnhancedAmazonScraper(headless=HEADLESS_MODE, enable_proxy=ENABLE_PROXY)
-
-            print("\n🌐 Starting scraper...\n")
-            result = scraper.run_scraper(product_name, max_products_per_session=MAX_PRODUCTS, max_pages=MAX_PAGES)
-
-            print("\n🎯 Scraper Finished!")
-            print(f"   - Status: [{result.status_code.value}] {result.message}")
-            
-            if result.data:
-                print(f"📊 Summary:")
-                print(f"   - Products Scraped: {result.data['total_scraped']}")
-                print(f"   - Pages Processed: {result.data['pages_scraped']}")
-            
-            # File locations
-            safe_name = product_name.replace(" ", "_").lower() if product_name else "amazon_products"
-            csv_file = os.path.join(scraper.csv_dir, f"{safe_name}.csv")
-            json_file = os.path.join(scraper.json_dir, f"{safe_name}.json")
-            
-            if os.path.exists(csv_file):
-                print(f"📄 CSV saved: {os.path.abspath(csv_file)}")
-            if os.path.exists(json_file):
-                print(f"📝 JSON saved: {os.path.abspath(json_file)}")
-            
-            print("\n✅ Scraping completed successfully!")
-        
-        except KeyboardInterrupt:
-            print("\n🛑 Scraper interrupted by user (Ctrl+C).")
-            if scraper:
-                print("🔄 Cleaning up resources...")
-        except Exception as e:
-            print(f"\n❌ Unexpected error: {str(e)}")
-            if scraper:
-                print("🔄 Cleaning up resources...")
-        finally:
-            if scraper:
-                try:
-                    scraper.cleanup()
-                except Exception:
-                    print("⚠️ Cleanup completed with minor issues.")
-            
-            print("🏁 Scraper session ended.")
\ No newline at end of file
+    main()
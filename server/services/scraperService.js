@@ -14,6 +14,20 @@ const __dirname = dirname(__filename);
 // Active job processes in memory
 const activeJobs = new Map();
 
+// Attach-mode jobs all drive the one Chrome on SCRAPER_ATTACH_PORT, so they run one at a time
+let attachedBrowserQueue = Promise.resolve();
+
+/**
+ * Wait until no other attach-mode job is using the shared Chrome; returns the release callback
+ */
+const acquireAttachedBrowser = async () => {
+  const previous = attachedBrowserQueue;
+  let release;
+  attachedBrowserQueue = new Promise((resolve) => (release = resolve));
+  await previous;
+  return release;
+};
+
 /**
  * Start scraping process by spawning Python script
  */
@@ -24,6 +38,10 @@ const startScrapingProcess = async (
   maxPages,
   headless = false
 ) => {
+  const releaseBrowser = process.env.SCRAPER_ATTACH_PORT
+    ? await acquireAttachedBrowser()
+    : () => {};
+
   try {
     console.log(`🚀 Starting scraping job: ${jobId}`);
 
@@ -49,6 +67,11 @@ const startScrapingProcess = async (
     ];
 
     if (headless) args.push("--headless");
+    // Fetch result pages over plain HTTP; the scraper falls back to Chrome on a robot check
+    if (process.env.SCRAPER_USE_HTTP === "true") args.push("--http");
+    // Reuse a long-running Chrome (started with --remote-debugging-port) instead of launching one per job
+    if (process.env.SCRAPER_ATTACH_PORT)
+      args.push("--attach-port", process.env.SCRAPER_ATTACH_PORT);
 
     const pythonEnv = {
       ...process.env,
@@ -84,6 +107,7 @@ const startScrapingProcess = async (
     pythonProcess.on("close", async (code) => {
       console.log(`🏁 [${jobId}] Process exited with code ${code}`);
       activeJobs.delete(jobId);
+      releaseBrowser();
 
       if (code === 0) {
         await processScrapingResults(jobId, productName);
@@ -100,6 +124,7 @@ const startScrapingProcess = async (
       }
     });
   } catch (error) {
+    releaseBrowser();
     console.error(`❌ Error starting scraping process: ${error}`);
     await ScrapingJob.findOneAndUpdate(
       { jobId },